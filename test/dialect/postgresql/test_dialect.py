@@ -1,4 +1,5 @@
 import asyncio
+import copy
 import dataclasses
 import datetime
 import logging
@@ -32,7 +33,10 @@ from sqlalchemy import TypeDecorator
 from sqlalchemy.dialects.postgresql import asyncpg as asyncpg_dialect
 from sqlalchemy.dialects.postgresql import base as postgresql
 from sqlalchemy.dialects.postgresql import HSTORE
+from sqlalchemy.dialects.postgresql import INT4MULTIRANGE
+from sqlalchemy.dialects.postgresql import INT4RANGE
 from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import MultiRange
 from sqlalchemy.dialects.postgresql import psycopg as psycopg_dialect
 from sqlalchemy.dialects.postgresql import psycopg2 as psycopg2_dialect
 from sqlalchemy.dialects.postgresql import Range
@@ -58,6 +62,7 @@ from sqlalchemy.testing.assertions import eq_
 from sqlalchemy.testing.assertions import eq_regex
 from sqlalchemy.testing.assertions import expect_raises
 from sqlalchemy.testing.assertions import ne_
+from sqlalchemy.util import greenlet_spawn
 
 
 def _fk_expected(
@@ -371,6 +376,180 @@ $$ LANGUAGE plpgsql;"""
 
         eq_(dialect.is_disconnect("not an error", None, None), False)
 
+    @testing.combinations(
+        ("3.0.2", (3, 0, 2)),
+        ("3.1", (3, 1)),
+        ("3.2.1.dev1", (3, 2, 1)),
+        ("3.1b2", (3, 1)),
+        ("garbage", None),
+    )
+    def test_psycopg_version_parse(self, version_string, expected):
+        eq_(psycopg_dialect._parse_psycopg_version(version_string), expected)
+
+    def test_psycopg_bind_processors_no_dbapi(self):
+        """psycopg bind processors can be set up for a dialect that
+        was created without a DBAPI, such as when compiling with
+        render_postcompile"""
+
+        t = Table(
+            "t",
+            MetaData(),
+            Column("id", Integer),
+            Column("j", JSONB),
+            Column("r", INT4RANGE),
+            Column("mr", INT4MULTIRANGE),
+        )
+        stmt = select(t).where(
+            t.c.j == bindparam("x", {"a": 1}),
+            t.c.r == bindparam("y", Range(1, 5)),
+            t.c.mr == bindparam("z", MultiRange([Range(1, 5)])),
+            t.c.id.in_([1, 2]),
+        )
+        compiled = stmt.compile(
+            dialect=psycopg_dialect.dialect(),
+            compile_kwargs={"render_postcompile": True},
+        )
+        assert "IN (%(id_1_1)s::INTEGER, %(id_1_2)s::INTEGER)" in str(compiled)
+
+    def test_psycopg_async_dbapi_attributes(self):
+        class Error(Exception):
+            pass
+
+        psycopg = mock.Mock(
+            spec=["Error", "paramstyle", "__version__", "connect"],
+            Error=Error,
+            paramstyle="pyformat",
+            __version__="3.2.1",
+        )
+        dbapi = psycopg_dialect.PsycopgAdaptDBAPI(psycopg, mock.Mock())
+
+        for adapted in (dbapi, copy.copy(dbapi)):
+            is_(adapted.Error, Error)
+            eq_(adapted.paramstyle, "pyformat")
+            eq_(adapted.__version__, "3.2.1")
+            eq_(adapted.connect.__func__, dbapi.connect.__func__)
+
+    @testing.combinations(None, "SERIALIZABLE", argnames="isolation_level")
+    def test_psycopg_on_connect(self, isolation_level):
+        dialect = psycopg_dialect.dialect()
+        dialect.isolation_level = isolation_level
+        conn = mock.Mock()
+
+        with mock.patch.object(dialect, "set_isolation_level") as set_iso:
+            dialect.on_connect()(conn)
+
+        eq_(
+            conn.mock_calls,
+            [mock.call.add_notice_handler(psycopg_dialect._log_notices)],
+        )
+        if isolation_level is None:
+            eq_(set_iso.mock_calls, [])
+        else:
+            eq_(set_iso.mock_calls, [mock.call(conn, isolation_level)])
+
+    @testing.combinations(True, False, argnames="info_enabled")
+    def test_psycopg_log_notices(self, info_enabled):
+        diagnostic = mock.Mock(severity="NOTICE", message_primary="hi")
+
+        with mock.patch.object(psycopg_dialect, "logger") as logger:
+            logger.isEnabledFor.return_value = info_enabled
+            psycopg_dialect._log_notices(diagnostic)
+
+        if info_enabled:
+            eq_(
+                logger.info.mock_calls,
+                [mock.call("%s: %s", "NOTICE", "hi")],
+            )
+        else:
+            eq_(logger.info.mock_calls, [])
+
+    @testing.combinations(
+        ("AUTOCOMMIT", True, None),
+        ("READ COMMITTED", False, "READ_COMMITTED"),
+        ("READ UNCOMMITTED", False, "READ_UNCOMMITTED"),
+        ("REPEATABLE READ", False, "REPEATABLE_READ"),
+        ("SERIALIZABLE", False, "SERIALIZABLE"),
+        argnames="level,autocommit,psycopg_level",
+    )
+    def test_psycopg_set_isolation_level(
+        self, level, autocommit, psycopg_level
+    ):
+        dialect = psycopg_dialect.dialect()
+        dialect.dbapi = dbapi = mock.Mock()
+        conn = mock.Mock()
+
+        with mock.patch.object(dialect, "_do_isolation_level") as do_iso:
+            dialect.set_isolation_level(conn, level)
+
+        expected_level = (
+            getattr(dbapi.IsolationLevel, psycopg_level)
+            if psycopg_level
+            else None
+        )
+        eq_(
+            do_iso.mock_calls,
+            [
+                mock.call(
+                    conn,
+                    autocommit=autocommit,
+                    isolation_level=expected_level,
+                )
+            ],
+        )
+
+    @testing.combinations(
+        (True, False, True, True),
+        (False, True, True, True),
+        (False, False, True, False),
+        (True, True, False, False),
+        argnames="closed,broken,is_dbapi_error,expected",
+    )
+    def test_psycopg_is_disconnect(
+        self, closed, broken, is_dbapi_error, expected
+    ):
+        class Error(Exception):
+            pass
+
+        dialect = psycopg_dialect.dialect()
+        dialect.dbapi = mock.Mock(Error=Error)
+        conn = mock.Mock(closed=closed, broken=broken)
+        exc = Error() if is_dbapi_error else ValueError()
+
+        eq_(dialect.is_disconnect(exc, conn, None), expected)
+        is_false(dialect.is_disconnect(Error(), None, None))
+
+    @testing.combinations(
+        ("IDLE", "INTRANS", True),
+        ("IDLE", "IDLE", False),
+        ("INTRANS", "INTRANS", False),
+        argnames="status_before,status_after,expect_rollback",
+    )
+    def test_psycopg_get_isolation_level_rollback(
+        self, status_before, status_after, expect_rollback
+    ):
+        dialect = psycopg_dialect.dialect()
+        conn = mock.Mock()
+        conn.info.transaction_status = status_before
+
+        def show_isolation_level(dbapi_connection):
+            dbapi_connection.info.transaction_status = status_after
+            return "READ COMMITTED"
+
+        # _psycopg_TransactionStatus_IDLE resolves lazily from this
+        with mock.patch.object(
+            psycopg_dialect.PGDialect_psycopg,
+            "_psycopg_TransactionStatus",
+            mock.Mock(IDLE="IDLE"),
+        ):
+            with mock.patch.object(
+                postgresql.PGDialect,
+                "get_isolation_level",
+                side_effect=show_isolation_level,
+            ):
+                eq_(dialect.get_isolation_level(conn), "READ COMMITTED")
+
+        eq_(conn.rollback.mock_calls, [mock.call()] if expect_rollback else [])
+
 
 class MultiHostConnectTest(fixtures.TestBase):
     def working_combinations():
@@ -1763,3 +1942,115 @@ class Psycopg3Test(fixtures.TestBase):
                 is_true(isinstance(cursor, AsyncClientCursor))
 
         await engine.dispose()
+
+
+class AsyncPsycopgCursorTest(fixtures.TestBase):
+    """test the asyncio psycopg cursor adapters against a mock
+    psycopg cursor"""
+
+    __requires__ = ("greenlet",)
+
+    def _fixture(self, nrows=5):
+        class Cursor:
+            description = [("x",)]
+            arraysize = 2
+            itersize = 3
+            pgresult = mock.Mock(status="TUPLES_OK")
+
+            def __init__(self, name=None):
+                self.pending = []
+                self.fetchmany_sizes = []
+
+            async def __aenter__(self):
+                return self
+
+            async def execute(self, operation, parameters=None):
+                self.pending = [(i,) for i in range(nrows)]
+
+            async def fetchall(self):
+                rows, self.pending = self.pending, []
+                return rows
+
+            async def fetchmany(self, size):
+                self.fetchmany_sizes.append(size)
+                rows = self.pending[:size]
+                del self.pending[:size]
+                return rows
+
+            def _close(self):
+                pass
+
+        connection = mock.Mock(cursor=mock.Mock(side_effect=Cursor))
+        adapt_connection = mock.Mock(
+            _connection=connection,
+            dbapi=mock.Mock(ExecStatus=mock.Mock(TUPLES_OK="TUPLES_OK")),
+        )
+        return adapt_connection
+
+    @testing.async_test
+    async def test_fetch_mixed(self):
+        def go():
+            cursor = psycopg_dialect.AsyncAdapt_psycopg_cursor(self._fixture())
+            cursor.execute("select")
+            eq_(cursor.fetchone(), (0,))
+            eq_(cursor.fetchmany(), [(1,), (2,)])
+            eq_(cursor.fetchmany(5), [(3,), (4,)])
+            eq_(cursor.fetchone(), None)
+            eq_(cursor.fetchmany(), [])
+            eq_(cursor.fetchall(), [])
+
+            cursor.execute("select")
+            eq_(cursor.fetchmany(3), [(0,), (1,), (2,)])
+            eq_(list(cursor), [(3,), (4,)])
+            eq_(cursor.fetchall(), [])
+
+        await greenlet_spawn(go)
+
+    @testing.async_test
+    async def test_iterate_then_fetchall(self):
+        def go():
+            cursor = psycopg_dialect.AsyncAdapt_psycopg_cursor(self._fixture())
+            cursor.execute("select")
+            it = iter(cursor)
+            eq_(next(it), (0,))
+            eq_(cursor.fetchall(), [(1,), (2,), (3,), (4,)])
+            eq_(list(it), [])
+
+        await greenlet_spawn(go)
+
+    @testing.async_test
+    async def test_close_and_reexecute(self):
+        def go():
+            cursor = psycopg_dialect.AsyncAdapt_psycopg_cursor(self._fixture())
+            cursor.execute("select")
+            it = iter(cursor)
+            eq_(next(it), (0,))
+            cursor.close()
+            eq_(list(it), [])
+            eq_(cursor.fetchone(), None)
+            eq_(cursor.fetchall(), [])
+
+            cursor.execute("select")
+            eq_(cursor.fetchone(), (0,))
+            cursor.execute("select")
+            eq_(cursor.fetchall(), [(0,), (1,), (2,), (3,), (4,)])
+
+        await greenlet_spawn(go)
+
+    @testing.combinations(
+        (7, [3, 3, 3]), (6, [3, 3, 3]), (0, [3]), argnames="nrows,sizes"
+    )
+    @testing.async_test
+    async def test_ss_cursor_iterate_batches(self, nrows, sizes):
+        def go():
+            cursor = psycopg_dialect.AsyncAdapt_psycopg_ss_cursor(
+                self._fixture(nrows), "c1"
+            )
+            cursor._cursor.pending = [(i,) for i in range(nrows)]
+            eq_(list(cursor), [(i,) for i in range(nrows)])
+
+            # each batch is fetched using the psycopg cursor's itersize,
+            # stopping at the first short or empty batch
+            eq_(cursor._cursor.fetchmany_sizes, sizes)
+
+        await greenlet_spawn(go)